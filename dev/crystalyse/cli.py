@@ -4,6 +4,7 @@ Crystalyse v1.0.0-dev - Intelligent Scientific AI Agent for Inorganic Materials
 
 import asyncio
 import logging
+import os
 import sys
 import warnings
 from enum import Enum
@@ -415,7 +416,7 @@ def analyse_provenance(
         for session in sessions[:10]:  # Show last 10
             summary_file = session / "summary.json"
             if summary_file.exists():
-                with open(summary_file) as f:
+                with open(summary_file, encoding="utf-8") as f:
                     summary = json.load(f)
                     table.add_row(
                         session.name,
@@ -436,7 +437,7 @@ def analyse_provenance(
         console.print("[red]Summary file not found for this session[/red]")
         return
 
-    with open(summary_file) as f:
+    with open(summary_file, encoding="utf-8") as f:
         summary = json.load(f)
 
     # Display performance metrics
@@ -489,7 +490,7 @@ def analyse_provenance(
     # Display materials catalogue if available
     materials_file = session_dir / "materials_catalog.json"
     if materials_file.exists():
-        with open(materials_file) as f:
+        with open(materials_file, encoding="utf-8") as f:
             materials = json.load(f)
 
         if materials:
@@ -603,6 +604,22 @@ def main():
     run()
 
 
+def _run_app():
+    """Run the Typer app, under cProfile when CRYSTALYSE_PROFILE names an output file."""
+    profile_path = os.getenv("CRYSTALYSE_PROFILE")
+    if not profile_path:
+        app()
+        return
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(app)
+    finally:
+        profiler.dump_stats(profile_path)
+
+
 def run():
     """Main entry point."""
     # Setup logging
@@ -617,7 +634,7 @@ def run():
         sys.argv.append("chat")
 
     try:
-        app()
+        _run_app()
     except KeyboardInterrupt:
         console.print("\n[cyan]Crystalyse session ended.[/cyan]")
     except Exception as e:
@@ -1,11 +1,18 @@
 """Central configuration management for CrystaLyse.AI"""
 
+import importlib.util
 import os
 import shutil
 import sys
 from pathlib import Path
 from typing import Any
 
+# Optional Python dependencies checked by validate_environment: (status key, module name)
+_OPTIONAL_DEPENDENCIES = (
+    ("openai_agents", "agents"),
+    ("mcp", "mcp"),
+)
+
 
 class CrystaLyseConfig:
     """Central configuration management with environment variable support"""
@@ -80,6 +87,7 @@ class CrystaLyseConfig:
             "show_summary": os.getenv("CRYSTALYSE_SHOW_PROVENANCE_SUMMARY", "true").lower()
             == "true",
             "visual_trace": os.getenv("CRYSTALYSE_VISUAL_TRACE", "true").lower() == "true",
+            "pretty_json": os.getenv("CRYSTALYSE_PRETTY_JSON", "false").lower() == "true",
         }
 
         # Render Gate Configuration (Intelligent hallucination prevention)
@@ -170,19 +178,11 @@ class CrystaLyseConfig:
                 status["servers"][server_name]["available"] = True
 
         # Check Python dependencies
-        import importlib.util
-
-        if importlib.util.find_spec("agents") is not None:
-            status["dependencies"]["openai_agents"] = True
-        else:
-            status["dependencies"]["openai_agents"] = False
-            status["overall"] = "degraded"
-
-        if importlib.util.find_spec("mcp") is not None:
-            status["dependencies"]["mcp"] = True
-        else:
-            status["dependencies"]["mcp"] = False
-            status["overall"] = "degraded"
+        for key, module in _OPTIONAL_DEPENDENCIES:
+            available = importlib.util.find_spec(module) is not None
+            status["dependencies"][key] = available
+            if not available:
+                status["overall"] = "degraded"
 
         return status
 
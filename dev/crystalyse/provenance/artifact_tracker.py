@@ -51,7 +51,7 @@ class Artifact:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedValue:
     """
     A specific numerical value extracted from an artifact.
@@ -125,7 +125,9 @@ class ArtifactTracker:
             self.value_index[extracted.value].append(artifact_id)
 
         logger.info(
-            f"Registered artifact from {tool_name}: {len(artifact.extracted_values)} values extracted"
+            "Registered artifact from %s: %d values extracted",
+            tool_name,
+            len(artifact.extracted_values),
         )
 
         return artifact_id
@@ -3,13 +3,19 @@ JSONL Event Logger for structured provenance capture
 """
 
 import json
-from dataclasses import asdict, dataclass
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     """Represents a single provenance event."""
 
@@ -18,16 +24,29 @@ class Event:
     data: dict[str, Any]
 
     def to_jsonl(self) -> str:
-        """Convert to JSONL string."""
-        return json.dumps(asdict(self))
+        """Convert to JSONL string (uses orjson when installed)."""
+        record = {"type": self.type, "ts": self.ts, "data": self.data}
+        if orjson is not None:
+            return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(record)
 
 
 class JSONLLogger:
     """
     Logger that writes events to JSONL files.
     Each line is a complete JSON object for streaming processing.
+
+    Events are buffered and written through a persistent file handle,
+    flushed once FLUSH_EVERY events are buffered, on the first event
+    logged FLUSH_INTERVAL_S seconds or more after the last flush, at
+    session end, and on flush()/close(). The interval is only checked
+    when an event is logged, so an idle logger holds its buffer until
+    the next event. Owners must call close() to release the file handle.
     """
 
+    FLUSH_EVERY = 64
+    FLUSH_INTERVAL_S = 0.25
+
     def __init__(self, path: Path) -> None:
         """
         Initialize logger with output path.
@@ -36,8 +55,9 @@ class JSONLLogger:
             path: Path to JSONL file
         """
         self.path = Path(path)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         self._file = None
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
         self._event_count = 0
 
     def log(self, event_type: str, data: dict[str, Any]) -> None:
@@ -50,12 +70,40 @@ class JSONLLogger:
         """
         event = Event(type=event_type, ts=datetime.utcnow().isoformat(), data=data)
 
-        # Write immediately for real-time tracking
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(event.to_jsonl() + "\n")
-
+        self._buffer.append(event.to_jsonl() + "\n")
         self._event_count += 1
 
+        if (
+            len(self._buffer) >= self.FLUSH_EVERY
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_S
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events to the JSONL file."""
+        if self._buffer:
+            if self._file is None:
+                # Create the parent directory only when there is something to write
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write("".join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush buffered events and close the file handle."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def log_session_start(self, session_id: str, metadata: dict | None = None) -> None:
         """Log session start with metadata."""
         data = {"session_id": session_id, "timestamp": datetime.now().isoformat(), "event_count": 0}
@@ -72,6 +120,7 @@ class JSONLLogger:
             **summary,
         }
         self.log("session_end", data)
+        self.flush()
 
     def log_tool_start(self, tool_name: str, call_id: str, args: dict | None = None) -> None:
         """Log tool call start."""
@@ -116,6 +165,7 @@ class JSONLLogger:
 
     def read_events(self) -> list:
         """Read all events from the file."""
+        self.flush()
         if not self.path.exists():
             return []
 
@@ -6,14 +6,49 @@ Enhanced for Phase 1.5 with Pydantic model support.
 
 import json
 import logging
+import re
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Element symbols followed by optional counts, e.g. "Co" and "2" in "CoO2"
+_ELEMENT_COUNT_PATTERN = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_formula(composition: str) -> str:
+    """Rebuild a formula with its elements in alphabetical order."""
+    # Parse elements and their counts from the formula
+    elements = {}
+    for element, count in _ELEMENT_COUNT_PATTERN.findall(composition):
+        count = int(count) if count else 1
+        if element in elements:
+            elements[element] += count
+        else:
+            elements[element] = count
+
+    # Rebuild formula in alphabetical order
+    sorted_elements = sorted(elements.keys())
+    normalized = ""
+    for element in sorted_elements:
+        count = elements[element]
+        if count == 1:
+            normalized += element
+        else:
+            normalized += f"{element}{count}"
+
+    return normalized
+
 
-@dataclass
+@dataclass(slots=True)
 class Material:
     """
     Represents a discovered material with enhanced Phase 1.5 metadata.
@@ -72,33 +107,9 @@ class MaterialsTracker:
         """
         Normalize composition string to handle different element orderings.
         E.g., "LiCoO2" and "CoLiO2" both become "CoLiO2" (alphabetical order).
+        Results are cached by formula, since the same compositions recur.
         """
-        import re
-
-        # Parse elements and their counts from the formula
-        elements = {}
-        # Match element symbols followed by optional numbers
-        pattern = r"([A-Z][a-z]?)(\d*)"
-        matches = re.findall(pattern, composition)
-
-        for element, count in matches:
-            count = int(count) if count else 1
-            if element in elements:
-                elements[element] += count
-            else:
-                elements[element] = count
-
-        # Rebuild formula in alphabetical order
-        sorted_elements = sorted(elements.keys())
-        normalized = ""
-        for element in sorted_elements:
-            count = elements[element]
-            if count == 1:
-                normalized += element
-            else:
-                normalized += f"{element}{count}"
-
-        return normalized
+        return _normalize_formula(composition)
 
     def extract_from_output(self, output: Any, tool_name: str | None = None) -> list[Material]:
         """
@@ -160,11 +171,12 @@ class MaterialsTracker:
                 materials = self._extract_generic(data)
 
             # Add source tool and timestamp
+            timestamp = datetime.now().isoformat()
             for material in materials:
                 if tool_name:
                     material.source_tool = tool_name
                 if not material.timestamp:
-                    material.timestamp = datetime.now().isoformat()
+                    material.timestamp = timestamp
 
             # Track materials with deduplication
             for mat in materials:
@@ -195,7 +207,7 @@ class MaterialsTracker:
                     self._unique_materials[normalized_comp] = mat
 
         except Exception as e:
-            logger.error(f"Failed to extract materials: {e}")
+            logger.error("Failed to extract materials: %s", e)
 
         return materials
 
@@ -598,9 +610,10 @@ class MaterialsTracker:
         # Use unique materials for accurate counts
         unique_materials = list(self._unique_materials.values())
         total = len(unique_materials)
-        with_energy = sum(1 for m in unique_materials if m.has_energy)
 
+        # Extract the energy column once; counts and stats derive from it
         energies = [m.formation_energy for m in unique_materials if m.has_energy]
+        with_energy = len(energies)
 
         summary = {
             "total_materials": total,  # Now reports unique materials count
@@ -686,5 +699,15 @@ class MaterialsTracker:
         else:
             catalog_data = self.to_catalog()
 
-        with open(catalog_path, "w") as f:
-            json.dump(catalog_data, f, indent=2, default=str)
+        if orjson is not None:
+            catalog_path.write_bytes(
+                orjson.dumps(
+                    catalog_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+        else:
+            catalog_path.write_text(json.dumps(catalog_data, indent=2, default=str))
@@ -56,6 +56,36 @@ class MCPDetector:
         "visualize_structure": ["visualization_url", "structure_data"],
     }
 
+    # Tool categories for metrics grouping
+    TOOL_CATEGORIES = {
+        # Original tools
+        "comprehensive_materials_analysis": "analysis",
+        "creative_discovery_pipeline": "generation",
+        # Phase 1.5 SMACT tools
+        "validate_composition": "validation",
+        "estimate_band_gap": "calculation",
+        "predict_dopants": "analysis",
+        "smact_validate_fast": "validation",
+        "generate_ml_representation": "analysis",
+        "filter_compositions": "validation",
+        # Phase 1.5 Chemeleon tools
+        "generate_crystal_csp": "generation",
+        # Phase 1.5 MACE tools
+        "calculate_formation_energy": "calculation",
+        "relax_structure": "optimization",
+        "calculate_stress": "calculation",
+        "fit_equation_of_state": "calculation",
+        "list_foundation_models": "utility",
+        # Phase 1.5 PyMatgen tools
+        "analyze_space_group": "analysis",
+        "calculate_energy_above_hull": "calculation",
+        "analyze_coordination": "analysis",
+        "analyze_oxidation_states": "validation",
+        # Phase 1.5 Visualization tools
+        "save_structure_as_cif": "visualization",
+        "visualize_structure": "visualization",
+    }
+
     @classmethod
     def detect_tool(cls, output: Any) -> str | None:
         """
@@ -114,7 +144,7 @@ class MCPDetector:
             return None
 
         except Exception as e:
-            logger.debug(f"Failed to detect MCP tool: {e}")
+            logger.debug("Failed to detect MCP tool: %s", e)
             return None
 
     @classmethod
@@ -171,32 +201,4 @@ class MCPDetector:
         Returns:
             Tool category (generation, validation, calculation, visualization, analysis)
         """
-        categories = {
-            # Original tools
-            "comprehensive_materials_analysis": "analysis",
-            "creative_discovery_pipeline": "generation",
-            # Phase 1.5 SMACT tools
-            "validate_composition": "validation",
-            "estimate_band_gap": "calculation",
-            "predict_dopants": "analysis",
-            "smact_validate_fast": "validation",
-            "generate_ml_representation": "analysis",
-            "filter_compositions": "validation",
-            # Phase 1.5 Chemeleon tools
-            "generate_crystal_csp": "generation",
-            # Phase 1.5 MACE tools
-            "calculate_formation_energy": "calculation",
-            "relax_structure": "optimization",
-            "calculate_stress": "calculation",
-            "fit_equation_of_state": "calculation",
-            "list_foundation_models": "utility",
-            # Phase 1.5 PyMatgen tools
-            "analyze_space_group": "analysis",
-            "calculate_energy_above_hull": "calculation",
-            "analyze_coordination": "analysis",
-            "analyze_oxidation_states": "validation",
-            # Phase 1.5 Visualization tools
-            "save_structure_as_cif": "visualization",
-            "visualize_structure": "visualization",
-        }
-        return categories.get(tool_name, "other")
+        return cls.TOOL_CATEGORIES.get(tool_name, "other")
@@ -52,7 +52,7 @@ def serialize_pydantic_model(obj: Any) -> dict | list | str | int | float | bool
         try:
             return obj.model_dump(exclude_none=True, mode="json")
         except Exception as e:
-            logger.debug(f"model_dump failed: {e}, trying fallback")
+            logger.debug("model_dump failed: %s, trying fallback", e)
             try:
                 return obj.model_dump()
             except Exception:
@@ -63,7 +63,7 @@ def serialize_pydantic_model(obj: Any) -> dict | list | str | int | float | bool
         try:
             return obj.dict(exclude_none=True)
         except Exception as e:
-            logger.debug(f"dict() failed: {e}, trying without exclude_none")
+            logger.debug("dict() failed: %s, trying without exclude_none", e)
             try:
                 return obj.dict()
             except Exception:
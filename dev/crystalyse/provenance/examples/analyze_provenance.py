@@ -26,7 +26,7 @@ def load_session_data(session_dir: Path) -> dict:
     # Load events
     events_file = session_dir / "events.jsonl"
     if events_file.exists():
-        with open(events_file) as f:
+        with open(events_file, encoding="utf-8") as f:
             for line in f:
                 if line.strip():
                     data["events"].append(json.loads(line))
@@ -34,13 +34,13 @@ def load_session_data(session_dir: Path) -> dict:
     # Load materials catalog
     catalog_file = session_dir / "materials_catalog.json"
     if catalog_file.exists():
-        with open(catalog_file) as f:
+        with open(catalog_file, encoding="utf-8") as f:
             data["materials"] = json.load(f)
 
     # Load summary
     summary_file = session_dir / "summary.json"
     if summary_file.exists():
-        with open(summary_file) as f:
+        with open(summary_file, encoding="utf-8") as f:
             data["summary"] = json.load(f)
 
     # Load assistant response
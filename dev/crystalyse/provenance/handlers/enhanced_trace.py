@@ -12,6 +12,11 @@ from typing import Any
 
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import core components - use relative imports within crystalyse.provenance
 from ..core import JSONLLogger, MaterialsTracker, MCPDetector
 from ..core.pydantic_serializer import create_enhanced_material_record, serialize_pydantic_model
@@ -45,7 +50,15 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON (uses orjson when installed)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
+
+@dataclass(slots=True)
 class EnhancedToolCall:
     """Enhanced tool call tracking with MCP detection."""
 
@@ -53,7 +66,7 @@ class EnhancedToolCall:
     wrapper_name: str  # SDK wrapper name (often "unknown_tool")
     mcp_tool: str | None = None  # Actual MCP tool detected
     args: dict[str, Any] = None
-    start_time: float = 0
+    start_time: float = 0  # time.monotonic() seconds, for durations only
     end_time: float | None = None
     output: Any | None = None
     materials_extracted: list[Any] = None
@@ -92,6 +105,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         enable_visual: bool = True,
         capture_mcp_logs: bool = False,
         save_raw_outputs: bool = True,
+        pretty_raw_outputs: bool = False,
     ):
         """
         Initialize provenance handler.
@@ -104,6 +118,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             enable_visual: Show visual trace output
             capture_mcp_logs: Attempt to capture MCP server logs
             save_raw_outputs: Save raw tool outputs for debugging
+            pretty_raw_outputs: Indent raw tool output JSON (compact by default)
         """
         super().__init__(console or Console())
 
@@ -111,6 +126,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         self.enable_visual = enable_visual
         self.capture_mcp_logs = capture_mcp_logs
         self.save_raw_outputs = save_raw_outputs
+        self.pretty_raw_outputs = pretty_raw_outputs
 
         # Session management
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -131,7 +147,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             # State tracking
             self.tool_calls: dict[str, EnhancedToolCall] = {}
             self.tool_counter = 0
-            self.run_start_time = time.time()
+            self.run_start_time = time.monotonic()
             self.first_token_time: float | None = None
             self.assistant_buffer: list[str] = []
 
@@ -160,17 +176,15 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             return
 
         # DEBUG: Log all event types
-        logger.debug(f"Event received: type={event.type}, has_item={hasattr(event, 'item')}")
+        logger.debug("Event received: type=%s, has_item=%s", event.type, hasattr(event, "item"))
         if hasattr(event, "item"):
-            logger.debug(
-                f"  Item type: {event.item.type if hasattr(event.item, 'type') else 'no type'}"
-            )
+            logger.debug("  Item type: %s", getattr(event.item, "type", "no type"))
 
         try:
             if event.type == "run_item_stream_event":
                 self._process_stream_event(event.item)
         except Exception as e:
-            logger.error(f"Error processing event: {e}")
+            logger.error("Error processing event: %s", e)
             if self.event_logger:
                 self.event_logger.log(
                     "error", {"error": str(e), "event_type": getattr(event, "type", "unknown")}
@@ -196,7 +210,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
 
         # Create tool call tracker
         tool_call = EnhancedToolCall(
-            call_id=call_id, wrapper_name=wrapper_name, args=args, start_time=time.time()
+            call_id=call_id, wrapper_name=wrapper_name, args=args, start_time=time.monotonic()
         )
         self.tool_calls[call_id] = tool_call
 
@@ -213,8 +227,9 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             return
 
         tool_call = self.tool_calls[call_id]
-        tool_call.end_time = time.time()
+        tool_call.end_time = time.monotonic()
         tool_call.output = item.output
+        timestamp = datetime.now().isoformat()
 
         # Serialize Pydantic models if present
         serialized_output = serialize_pydantic_model(item.output)
@@ -246,7 +261,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
                 tool_call_id=call_id,
                 input_data={},  # Could extract from tool_call.args if needed
                 output_data=serialized_output,
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
             )
 
         # Create enhanced material record for Phase 1.5 tools
@@ -254,7 +269,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             ("validate_", "calculate_", "analyze_", "predict_", "generate_")
         ):
             enhanced_record = create_enhanced_material_record(
-                mcp_tool, serialized_output, datetime.now().isoformat()
+                mcp_tool, serialized_output, timestamp
             )
             self.event_logger.log("enhanced_material", enhanced_record)
 
@@ -268,7 +283,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
                 "materials_count": len(materials),
                 "call_id": call_id,
                 "has_pydantic": hasattr(item.output, "model_dump") or hasattr(item.output, "dict"),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             },
         )
 
@@ -276,7 +291,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         """Capture assistant message output."""
         # Track first token time
         if not self.first_token_time:
-            self.first_token_time = time.time()
+            self.first_token_time = time.monotonic()
             ttfb = (self.first_token_time - self.run_start_time) * 1000
             self.event_logger.log(
                 "ttfb", {"time_ms": ttfb, "timestamp": datetime.now().isoformat()}
@@ -352,13 +367,13 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             raw_file = self.output_dir / f"raw_output_{call_id[:8]}.json"
 
             if isinstance(output, str):
-                with open(raw_file, "w") as f:
-                    f.write(output)
+                raw_file.write_text(output)
             else:
-                with open(raw_file, "w") as f:
-                    json.dump(output, f, indent=2)
+                raw_file.write_text(
+                    json.dumps(output, indent=2 if self.pretty_raw_outputs else None)
+                )
         except Exception as e:
-            logger.debug(f"Failed to save raw output: {e}")
+            logger.debug("Failed to save raw output: %s", e)
 
     def set_user_query(self, query: str):
         """
@@ -375,19 +390,18 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             return
 
         self.user_query = query
+        timestamp = datetime.now().isoformat()
         self.conversation_log.append(
             {
                 "role": "user",
                 "content": query,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "type": "query",
             }
         )
 
         if self.event_logger:
-            self.event_logger.log(
-                "user_query", {"query": query, "timestamp": datetime.now().isoformat()}
-            )
+            self.event_logger.log("user_query", {"query": query, "timestamp": timestamp})
 
     def add_clarification_exchange(
         self,
@@ -408,12 +422,13 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         if not self.enable_provenance:
             return
 
+        timestamp = datetime.now().isoformat()
         exchange = {
             "question": question,
             "answer": answer,
             "question_id": question_id,
             "options": options,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
         self.clarification_exchanges.append(exchange)
 
@@ -422,7 +437,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             {
                 "role": "assistant",
                 "content": question,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "type": "clarification_question",
                 "options": options,
             }
@@ -431,7 +446,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             {
                 "role": "user",
                 "content": answer,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "type": "clarification_answer",
                 "question_id": question_id,
             }
@@ -450,18 +465,19 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         if not self.enable_provenance:
             return
 
+        timestamp = datetime.now().isoformat()
         self.conversation_log.append(
             {
                 "role": "system",
                 "content": enriched_query,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "type": "enriched_query",
             }
         )
 
         if self.event_logger:
             self.event_logger.log(
-                "enriched_query", {"query": enriched_query, "timestamp": datetime.now().isoformat()}
+                "enriched_query", {"query": enriched_query, "timestamp": timestamp}
             )
 
     def _save_conversation_log(self):
@@ -534,10 +550,17 @@ class ProvenanceTraceHandler(ToolTraceHandler):
             f.write("\n".join(lines))
 
     def finalize(self) -> dict[str, Any]:
-        """Generate final summary and save outputs."""
+        """
+        Generate final summary and save outputs.
+
+        The materials log is closed here. The event log is only flushed so
+        callers can record follow-up events; they must close() it when done.
+        """
         if not self.enable_provenance or not self.event_logger:
             return {}
 
+        timestamp = datetime.now().isoformat()
+
         # Save assistant response (legacy file for backwards compatibility)
         full_response = ""
         if self.assistant_buffer:
@@ -550,7 +573,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
                 "assistant_output",
                 {
                     "length": len(full_response),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "session_id": self.session_id,
                 },
             )
@@ -567,7 +590,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
                     {
                         "role": "assistant",
                         "content": full_response,
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": timestamp,
                         "type": "response",
                     }
                 )
@@ -577,9 +600,7 @@ class ProvenanceTraceHandler(ToolTraceHandler):
 
         # Save conversation log as JSON for programmatic access
         if self.conversation_log:
-            conv_json_file = self.output_dir / "conversation.json"
-            with open(conv_json_file, "w") as f:
-                json.dump(self.conversation_log, f, indent=2)
+            _write_json(self.output_dir / "conversation.json", self.conversation_log)
 
         # Save materials catalog with enhanced metadata
         self.materials_tracker.save_catalog(
@@ -589,9 +610,12 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         # Generate summary
         materials_summary = self.materials_tracker.get_summary()
 
-        # Tool statistics
+        # Tool statistics (MCP operations tallied in the same pass)
         mcp_tools = {}
+        mcp_operations = 0
         for tc in self.tool_calls.values():
+            if tc.mcp_tool:
+                mcp_operations += 1
             tool_name = tc.mcp_tool or tc.wrapper_name
             if tool_name not in mcp_tools:
                 mcp_tools[tool_name] = {"count": 0, "total_ms": 0, "materials": 0}
@@ -607,15 +631,15 @@ class ProvenanceTraceHandler(ToolTraceHandler):
 
         summary = {
             "session_id": self.session_id,
-            "total_time_s": time.time() - self.run_start_time,
+            "total_time_s": time.monotonic() - self.run_start_time,
             "ttfb_ms": (self.first_token_time - self.run_start_time) * 1000
             if self.first_token_time
             else None,
             "tool_calls_total": len(self.tool_calls),
             "materials_found": materials_summary["total_materials"],
             "unique_compositions": materials_summary["unique_compositions"],
-            "mcp_operations": sum(1 for tc in self.tool_calls.values() if tc.mcp_tool),
-            "timestamp": datetime.now().isoformat(),
+            "mcp_operations": mcp_operations,
+            "timestamp": timestamp,
             "mcp_tools": mcp_tools,
             "materials_summary": {
                 "total": materials_summary["total_materials"],
@@ -627,10 +651,10 @@ class ProvenanceTraceHandler(ToolTraceHandler):
         }
 
         # Save summary
-        with open(self.output_dir / "summary.json", "w") as f:
-            json.dump(summary, f, indent=2)
+        _write_json(self.output_dir / "summary.json", summary)
 
-        # Log session end
+        # Log session end (flushes the event log); nothing writes materials after this
         self.event_logger.log_session_end(self.session_id, summary)
+        self.materials_logger.close()
 
         return summary
@@ -8,6 +8,7 @@ import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 dev_path = Path(__file__).parent.parent.parent / "dev"
@@ -23,6 +24,9 @@ from rich.console import Console
 
 from crystalyse.agents.openai_agents_bridge import EnhancedCrystaLyseAgent
 
+# Default discovery timeouts (seconds) per mode
+_MODE_TIMEOUTS = MappingProxyType({"creative": 180, "balanced": 300, "rigorous": 600})
+
 
 class CrystaLyseWithProvenance:
     """
@@ -79,13 +83,16 @@ class CrystaLyseWithProvenance:
         Returns:
             Discovery result with provenance summary
         """
+        # One clock read for both the session ID stem and the start event
+        started_at = datetime.now()
+
         # Generate session ID
         if not session_id:
-            session_id = f"{self.mode}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            session_id = f"{self.mode}_{started_at.strftime('%Y%m%d_%H%M%S')}"
 
         # Set timeout based on mode if not specified
         if timeout is None:
-            timeout = {"creative": 180, "balanced": 300, "rigorous": 600}.get(self.mode, 300)
+            timeout = _MODE_TIMEOUTS.get(self.mode, 300)
 
         # Initialize trace handler
         trace_handler = ProvenanceTraceHandler(
@@ -106,7 +113,7 @@ class CrystaLyseWithProvenance:
                     "query": query,
                     "mode": self.mode,
                     "timeout": timeout,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": started_at.isoformat(),
                 },
             )
 
@@ -148,6 +155,7 @@ class CrystaLyseWithProvenance:
                         "duration_s": provenance_summary.get("total_time_s", 0),
                     },
                 )
+                trace_handler.event_logger.close()
 
             return result
 
@@ -161,6 +169,8 @@ class CrystaLyseWithProvenance:
 
             # Still finalize to save partial results
             provenance_summary = trace_handler.finalize()
+            if trace_handler.event_logger:
+                trace_handler.event_logger.close()
 
             return {
                 "status": "timeout",
@@ -181,6 +191,8 @@ class CrystaLyseWithProvenance:
 
             # Finalize to save partial results
             provenance_summary = trace_handler.finalize()
+            if trace_handler.event_logger:
+                trace_handler.event_logger.close()
 
             return {
                 "status": "error",
@@ -211,7 +223,7 @@ class CrystaLyseWithProvenance:
         if catalog_file.exists():
             import json
 
-            with open(catalog_file) as f:
+            with open(catalog_file, encoding="utf-8") as f:
                 return json.load(f)
         return None
 
@@ -224,7 +236,7 @@ class CrystaLyseWithProvenance:
             events = []
             import json
 
-            with open(events_file) as f:
+            with open(events_file, encoding="utf-8") as f:
                 for line in f:
                     if line.strip():
                         events.append(json.loads(line))
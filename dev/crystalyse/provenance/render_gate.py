@@ -19,6 +19,53 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Mathematical operators and patterns, fused so one search covers them all
+_MATH_EXPRESSION_PATTERN = re.compile(
+    "|".join(
+        f"(?:{p})"
+        for p in [
+            r"\d+\s*[\+\-\*/]\s*\d+",  # Basic arithmetic
+            r"\d+\s*=\s*\d+",  # Equations
+            r"\(\s*\d+.*?\)",  # Parenthetical expressions
+            r"\d+\s*×\s*\d+",  # Multiplication symbol
+            r"∑|∏|∫",  # Mathematical symbols
+        ]
+    )
+)
+
+# Numerical values in LLM output, in order of precedence
+_NUMBER_PATTERN = re.compile(
+    "|".join(
+        f"({p})"
+        for p in [
+            # Scientific notation
+            r"-?\d+\.?\d*[eE][+-]?\d+",
+            # Decimal numbers with units
+            r"-?\d+\.?\d*\s*(?:eV|keV|MeV|GeV|kJ|kcal|Å|Angstrom|nm|pm|"
+            r"GPa|MPa|kPa|Pa|K|°C|°F|V|mV|mAh|Wh|g/cm³|g/mol)",
+            # Decimal numbers
+            r"-?\d+\.\d+",
+            # Integers with potential units
+            r"-?\d+\s*(?:%|percent)?",
+            # Ranges
+            r"-?\d+\.?\d*\s*(?:to|-|–|—)\s*-?\d+\.?\d*",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Unit suffix stripped from a detected number before parsing its value
+_UNIT_SUFFIX_PATTERN = re.compile(
+    r"\s*(eV|keV|MeV|GeV|kJ|kcal|Å|Angstrom|nm|pm|"
+    r"GPa|MPa|kPa|Pa|K|°C|°F|V|mV|mAh|Wh|g/cm³|g/mol|"
+    r"/atom|/mol|/unit).*$",
+    re.IGNORECASE,
+)
+
+# Chemical formula with at least two element groups, e.g. LiCoO2
+_FORMULA_PATTERN = re.compile(r"\b([A-Z][a-z]?(?:\d+)?(?:[A-Z][a-z]?(?:\d+)?)+)\b")
+_ELEMENT_SYMBOL_PATTERN = re.compile(r"[A-Z][a-z]?")
+
 
 class NumberType(Enum):
     """Classification of numerical values in LLM output."""
@@ -31,7 +78,7 @@ class NumberType(Enum):
     UNKNOWN = "unknown"  # Needs further analysis
 
 
-@dataclass
+@dataclass(slots=True)
 class ProvenanceTuple:
     """
     Tuple-based provenance as described in the paper.
@@ -56,7 +103,7 @@ class ProvenanceTuple:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedNumber:
     """A numerical value detected in LLM output."""
 
@@ -266,6 +313,18 @@ class IntelligentRenderGate:
         "journal",
     }
 
+    # Written mathematical operations
+    MATH_WORDS = {
+        "sum",
+        "product",
+        "difference",
+        "quotient",
+        "times",
+        "plus",
+        "minus",
+        "divided",
+    }
+
     def __init__(self, provenance_tracker=None):
         """
         Initialize the render gate.
@@ -293,9 +352,16 @@ class IntelligentRenderGate:
         """
         detected_numbers = self._detect_numbers(text)
 
+        # Classification depends only on the sentence, so classify each sentence once
+        sentence_types: dict[str, NumberType] = {}
+
         for num in detected_numbers:
             # Classify the number type
-            num.number_type = self._classify_number(num)
+            number_type = sentence_types.get(num.full_sentence)
+            if number_type is None:
+                number_type = self._classify_number(num)
+                sentence_types[num.full_sentence] = number_type
+            num.number_type = number_type
 
             # Check if it needs provenance
             if num.number_type == NumberType.MATERIAL_PROPERTY:
@@ -304,8 +370,9 @@ class IntelligentRenderGate:
                 if not num.provenance:
                     num.flags.add("UNPROVENANCED_MATERIAL_PROPERTY")
                     logger.warning(
-                        f"Unprovenanced material property detected: {num.value} "
-                        f"in context: '{num.context}'"
+                        "Unprovenanced material property detected: %s in context: '%s'",
+                        num.value,
+                        num.context,
                     )
 
         # Process the text based on findings
@@ -319,27 +386,10 @@ class IntelligentRenderGate:
         """
         numbers = []
 
-        # Regex patterns for different number formats
-        patterns = [
-            # Scientific notation
-            r"-?\d+\.?\d*[eE][+-]?\d+",
-            # Decimal numbers with units
-            r"-?\d+\.?\d*\s*(?:eV|keV|MeV|GeV|kJ|kcal|Å|Angstrom|nm|pm|"
-            r"GPa|MPa|kPa|Pa|K|°C|°F|V|mV|mAh|Wh|g/cm³|g/mol)",
-            # Decimal numbers
-            r"-?\d+\.\d+",
-            # Integers with potential units
-            r"-?\d+\s*(?:%|percent)?",
-            # Ranges
-            r"-?\d+\.?\d*\s*(?:to|-|–|—)\s*-?\d+\.?\d*",
-        ]
-
-        combined_pattern = "|".join(f"({p})" for p in patterns)
-
         sentences = text.split(".")
 
         for sentence in sentences:
-            for match in re.finditer(combined_pattern, sentence, re.IGNORECASE):
+            for match in _NUMBER_PATTERN.finditer(sentence):
                 # Get context (±50 chars)
                 start = max(0, match.start() - 50)
                 end = min(len(sentence), match.end() + 50)
@@ -430,40 +480,18 @@ class IntelligentRenderGate:
         Check if text contains mathematical expressions.
         """
         # Look for mathematical operators and patterns
-        math_patterns = [
-            r"\d+\s*[\+\-\*/]\s*\d+",  # Basic arithmetic
-            r"\d+\s*=\s*\d+",  # Equations
-            r"\(\s*\d+.*?\)",  # Parenthetical expressions
-            r"\d+\s*×\s*\d+",  # Multiplication symbol
-            r"∑|∏|∫",  # Mathematical symbols
-        ]
-
-        for pattern in math_patterns:
-            if re.search(pattern, text):
-                return True
+        if _MATH_EXPRESSION_PATTERN.search(text):
+            return True
 
         # Check for written mathematical operations
-        math_words = [
-            "sum",
-            "product",
-            "difference",
-            "quotient",
-            "times",
-            "plus",
-            "minus",
-            "divided",
-        ]
-        return sum(1 for word in math_words if word in text.lower()) >= 2
+        text_lower = text.lower()
+        return sum(1 for word in self.MATH_WORDS if word in text_lower) >= 2
 
     def _extract_material_context(self, text: str) -> str | None:
         """Extract material formula from text."""
-        # Pattern for chemical formulas
-        pattern = r"\b([A-Z][a-z]?(?:\d+)?(?:[A-Z][a-z]?(?:\d+)?)+)\b"
-        matches = re.findall(pattern, text)
-
-        for match in matches:
+        for match in _FORMULA_PATTERN.findall(text):
             # Check if it looks like a chemical formula
-            elements = re.findall(r"[A-Z][a-z]?", match)
+            elements = _ELEMENT_SYMBOL_PATTERN.findall(match)
             if len(elements) >= 2:  # At least 2 elements
                 return match
         return None
@@ -483,14 +511,7 @@ class IntelligentRenderGate:
             value_str = num.value.strip()
 
             # Remove units if present (more comprehensive pattern)
-            value_str = re.sub(
-                r"\s*(eV|keV|MeV|GeV|kJ|kcal|Å|Angstrom|nm|pm|"
-                r"GPa|MPa|kPa|Pa|K|°C|°F|V|mV|mAh|Wh|g/cm³|g/mol|"
-                r"/atom|/mol|/unit).*$",
-                "",
-                value_str,
-                flags=re.IGNORECASE,
-            ).strip()
+            value_str = _UNIT_SUFFIX_PATTERN.sub("", value_str).strip()
 
             # Parse the number
             value = float(value_str.replace(",", ""))
@@ -508,7 +529,7 @@ class IntelligentRenderGate:
             return provenance
 
         except (ValueError, AttributeError):
-            logger.debug(f"Could not parse value from: {num.value}")
+            logger.debug("Could not parse value from: %s", num.value)
             return None
 
     def _process_text(self, text: str, detected_numbers: list[DetectedNumber]) -> tuple[str, bool]:
@@ -533,7 +554,7 @@ class IntelligentRenderGate:
             self.blocked_values.append(num.value)
 
             # Log the violation
-            logger.info(f"[BLOCKED] Unprovenanced material property: {num.value}")
+            logger.info("[BLOCKED] Unprovenanced material property: %s", num.value)
 
             # TODO: Implement actual text replacement
             # For now, we just track what was blocked
@@ -574,16 +595,21 @@ class RenderGateValidator:
 
         processed, detected, has_violations = gate.analyze_output(response, provenance_data)
 
-        material_properties = [n for n in detected if n.number_type == NumberType.MATERIAL_PROPERTY]
-
-        unprovenanced = [n for n in material_properties if not n.provenance]
+        # Single pass: count material properties and collect unprovenanced ones
+        material_property_count = 0
+        unprovenanced = []
+        for n in detected:
+            if n.number_type == NumberType.MATERIAL_PROPERTY:
+                material_property_count += 1
+                if not n.provenance:
+                    unprovenanced.append(n)
 
         report = {
             "total_numbers": len(detected),
-            "material_properties": len(material_properties),
+            "material_properties": material_property_count,
             "unprovenanced_count": len(unprovenanced),
             "unprovenanced_rate": (
-                len(unprovenanced) / len(material_properties) if material_properties else 0
+                len(unprovenanced) / material_property_count if material_property_count else 0
             ),
             "violations": [
                 {"value": n.value, "context": n.context, "type": n.number_type.value}
@@ -623,8 +649,8 @@ def intercept_llm_output(text: str, provenance_data: dict | None = None) -> str:
 
     if has_violations:
         logger.warning(
-            f"Render gate detected {sum(1 for n in detected_numbers if n.flags)} "
-            f"unprovenanced material properties"
+            "Render gate detected %d unprovenanced material properties",
+            sum(1 for n in detected_numbers if n.flags),
         )
 
     return processed_text
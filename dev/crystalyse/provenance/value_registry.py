@@ -7,8 +7,9 @@ complete provenance lookup for the render gate.
 """
 
 import logging
+import math
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from .artifact_tracker import ArtifactTracker
@@ -17,8 +18,22 @@ from .render_gate import ProvenanceTuple
 
 logger = logging.getLogger(__name__)
 
+# Width of the buckets used to index registered values for fuzzy lookup
+_BUCKET_WIDTH = 0.01
 
-@dataclass
+
+def _bucket_of(value: float) -> int | None:
+    """Return the index bucket for a value, or None if it is too large to bucket."""
+    scaled = value / _BUCKET_WIDTH
+    return math.floor(scaled) if math.isfinite(scaled) else None
+
+
+# Chemical formulas like LiCoO2, CaTiO3, and the element symbols within them
+_FORMULA_PATTERN = re.compile(r"\b([A-Z][a-z]?(?:\d+)?(?:[A-Z][a-z]?(?:\d+)?)*)\b")
+_ELEMENT_SYMBOL_PATTERN = re.compile(r"[A-Z][a-z]?")
+
+
+@dataclass(slots=True)
 class ProvenancedValue:
     """
     A value with its complete provenance information.
@@ -72,6 +87,12 @@ class ProvenanceValueRegistry:
         # Material-specific registry
         self.material_registry: dict[str, list[ProvenancedValue]] = {}
 
+        # Bucketed index over registry keys so fuzzy lookups only probe nearby values
+        self._buckets: dict[int, list[float]] = {}
+        # Finite values too large to bucket are always scanned
+        self._unbucketed: list[float] = []
+        self._key_order: dict[float, int] = {}
+
     def register_tool_output(
         self,
         tool_name: str,
@@ -118,6 +139,7 @@ class ProvenanceValueRegistry:
             # Register in main registry
             if extracted.value not in self.registry:
                 self.registry[extracted.value] = []
+                self._index_value(extracted.value)
             self.registry[extracted.value].append(prov_value)
 
             # Register in material registry if applicable
@@ -126,7 +148,7 @@ class ProvenanceValueRegistry:
                     self.material_registry[material] = []
                 self.material_registry[material].append(prov_value)
 
-        logger.info(f"Registered {len(artifact.extracted_values)} values from {tool_name}")
+        logger.info("Registered %d values from %s", len(artifact.extracted_values), tool_name)
 
         return artifact_id
 
@@ -149,14 +171,15 @@ class ProvenanceValueRegistry:
         if abs(value) < 0.01:
             # Search for small values with wider tolerance
             wide_tolerance = 0.5  # Allow matching values up to ±0.5
-            for test_value, prov_values in self.registry.items():
-                if abs(test_value - value) < wide_tolerance:
-                    if material:
-                        for prov_value in prov_values:
-                            if prov_value.material == material:
-                                return prov_value.to_tuple()
-                    if prov_values:
-                        return prov_values[0].to_tuple()
+            test_value = self._nearest_key(value, wide_tolerance)
+            if test_value is not None:
+                prov_values = self.registry[test_value]
+                if material:
+                    for prov_value in prov_values:
+                        if prov_value.material == material:
+                            return prov_value.to_tuple()
+                if prov_values:
+                    return prov_values[0].to_tuple()
 
             # Also check artifact tracker with wider tolerance
             matches = self.artifact_tracker.lookup_value(value, wide_tolerance)
@@ -186,17 +209,19 @@ class ProvenanceValueRegistry:
                 return candidates[0].to_tuple()
 
         # Fuzzy matching
-        for test_value, prov_values in self.registry.items():
-            if abs(test_value - value) < tolerance:
-                # Prefer material-specific match
-                if material:
-                    for prov_value in prov_values:
-                        if prov_value.material == material:
-                            return prov_value.to_tuple()
+        test_value = self._nearest_key(value, tolerance)
+        if test_value is not None:
+            prov_values = self.registry[test_value]
 
-                # Return first match
-                if prov_values:
-                    return prov_values[0].to_tuple()
+            # Prefer material-specific match
+            if material:
+                for prov_value in prov_values:
+                    if prov_value.material == material:
+                        return prov_value.to_tuple()
+
+            # Return first match
+            if prov_values:
+                return prov_values[0].to_tuple()
 
         # Also check artifact tracker directly
         matches = self.artifact_tracker.lookup_value(value, tolerance)
@@ -213,6 +238,44 @@ class ProvenanceValueRegistry:
 
         return None
 
+    def _index_value(self, value: float):
+        """Add a newly registered value to the bucket index."""
+        self._key_order[value] = len(self._key_order)
+        if not math.isfinite(value):
+            return
+        bucket = _bucket_of(value)
+        if bucket is None:
+            self._unbucketed.append(value)
+        else:
+            self._buckets.setdefault(bucket, []).append(value)
+
+    def _nearest_key(self, value: float, tolerance: float) -> float | None:
+        """
+        Find the earliest registered value within tolerance of ``value``.
+
+        Only the buckets overlapping ``value ± tolerance`` are probed, falling
+        back to a full scan when that range spans more buckets than exist or
+        its bounds are too large to bucket.
+        """
+        if not math.isfinite(value):
+            return None
+
+        low = _bucket_of(value - tolerance)
+        high = _bucket_of(value + tolerance)
+        if low is None or high is None or high - low + 2 >= len(self._buckets):
+            candidates = self.registry
+        else:
+            candidates = [
+                key for bucket in range(low - 1, high + 2) for key in self._buckets.get(bucket, ())
+            ]
+            candidates.extend(self._unbucketed)
+
+        return min(
+            (key for key in candidates if abs(key - value) < tolerance),
+            key=self._key_order.__getitem__,
+            default=None,
+        )
+
     def lookup_material_properties(self, material: str) -> dict[str, ProvenancedValue]:
         """
         Get all provenanced properties for a material.
@@ -255,7 +318,7 @@ class ProvenanceValueRegistry:
             },
             "materials": materials,
             "registry": {
-                value: [pv.__dict__ for pv in prov_values]
+                value: [asdict(pv) for pv in prov_values]
                 for value, prov_values in self.registry.items()
             },
             "statistics": {
@@ -276,15 +339,10 @@ class ProvenanceValueRegistry:
                     return str(output_data[field])
 
         elif isinstance(output_data, str):
-            # Look for chemical formulas using regex
-            # Pattern for chemical formulas like LiCoO2, CaTiO3, etc.
-            pattern = r"\b([A-Z][a-z]?(?:\d+)?(?:[A-Z][a-z]?(?:\d+)?)*)\b"
-            matches = re.findall(pattern, output_data)
-
-            # Filter to likely chemical formulas
-            for match in matches:
+            # Filter formula-like matches to likely chemical formulas
+            for match in _FORMULA_PATTERN.findall(output_data):
                 # Must contain at least 2 elements
-                elements = re.findall(r"[A-Z][a-z]?", match)
+                elements = _ELEMENT_SYMBOL_PATTERN.findall(match)
                 if len(elements) >= 2:
                     return match
 
@@ -294,6 +352,9 @@ class ProvenanceValueRegistry:
         """Clear all registered values."""
         self.registry.clear()
         self.material_registry.clear()
+        self._buckets.clear()
+        self._unbucketed.clear()
+        self._key_order.clear()
         self.artifact_tracker = ArtifactTracker()
         logger.info("Provenance registry cleared")
 
@@ -107,6 +107,7 @@ class CrystaLyseProvenanceHandler(ProvenanceTraceHandler):
                 enable_visual=config.provenance["visual_trace"],
                 capture_mcp_logs=config.provenance["capture_mcp_logs"],
                 save_raw_outputs=config.provenance["capture_raw"],
+                pretty_raw_outputs=config.provenance.get("pretty_json", False),
                 **kwargs,
             )
             logger.info(f"Provenance handler initialised: {session_id}")
@@ -183,6 +184,9 @@ class CrystaLyseProvenanceHandler(ProvenanceTraceHandler):
         """
         try:
             summary = super().finalize()
+            # Nothing logs after finalisation here, so release the event log
+            if getattr(self, "event_logger", None):
+                self.event_logger.close()
 
             # Add CrystaLyse-specific metadata
             if summary:
@@ -300,7 +300,6 @@ class SlashCommandHandler:
 
         elif subcommand == "refresh":
             self.console.print("[yellow]Refreshing agent memory context...[/yellow]")
-            time.sleep(1)  # Simulate refresh
             self.console.print("[green]Memory context refreshed successfully.[/green]")
 
         else:
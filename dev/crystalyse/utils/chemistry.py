@@ -3,6 +3,57 @@
 import re
 from typing import Any
 
+# Metallic elements used to classify intermetallic compositions
+_METALS = frozenset(
+    {
+        "Li",
+        "Na",
+        "K",
+        "Rb",
+        "Cs",
+        "Be",
+        "Mg",
+        "Ca",
+        "Sr",
+        "Ba",
+        "Al",
+        "Ga",
+        "In",
+        "Sn",
+        "Pb",
+        "Bi",
+        "Sc",
+        "Ti",
+        "V",
+        "Cr",
+        "Mn",
+        "Fe",
+        "Co",
+        "Ni",
+        "Cu",
+        "Zn",
+        "Y",
+        "Zr",
+        "Nb",
+        "Mo",
+        "Tc",
+        "Ru",
+        "Rh",
+        "Pd",
+        "Ag",
+        "Cd",
+        "Hf",
+        "Ta",
+        "W",
+        "Re",
+        "Os",
+        "Ir",
+        "Pt",
+        "Au",
+        "Hg",
+    }
+)
+
 
 def analyse_application_requirements(application: str) -> dict[str, Any]:
     """
@@ -162,56 +213,8 @@ def classify_composition(composition: str) -> str:
         return "oxyanion"
     else:
         # Check if all elements are metals
-        metals = {
-            "Li",
-            "Na",
-            "K",
-            "Rb",
-            "Cs",
-            "Be",
-            "Mg",
-            "Ca",
-            "Sr",
-            "Ba",
-            "Al",
-            "Ga",
-            "In",
-            "Sn",
-            "Pb",
-            "Bi",
-            "Sc",
-            "Ti",
-            "V",
-            "Cr",
-            "Mn",
-            "Fe",
-            "Co",
-            "Ni",
-            "Cu",
-            "Zn",
-            "Y",
-            "Zr",
-            "Nb",
-            "Mo",
-            "Tc",
-            "Ru",
-            "Rh",
-            "Pd",
-            "Ag",
-            "Cd",
-            "Hf",
-            "Ta",
-            "W",
-            "Re",
-            "Os",
-            "Ir",
-            "Pt",
-            "Au",
-            "Hg",
-        }
-
         elements = re.findall(r"[A-Z][a-z]?", composition)
-        if all(elem in metals for elem in elements):
+        if set(elements) <= _METALS:
             return "intermetallic"
 
     return "mixed_anion"
@@ -9,6 +9,7 @@ import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -23,7 +24,7 @@ class ViolationType(Enum):
     CONFIDENCE_FABRICATION = "confidence_fabrication"  # Fake confidence scores
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationViolation:
     """Details about a validation violation."""
 
@@ -34,68 +35,118 @@ class ValidationViolation:
     suggested_fix: str
 
 
+# Regex patterns indicating computational results, grouped by category
+_COMPUTATIONAL_PATTERNS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    # Formation energies and energies
+    (
+        "formation_energy",
+        (
+            r"formation energy:?\s*-?\d+\.\d+\s*ev",
+            r"energy:?\s*-?\d+\.\d+\s*ev(?:/atom)?",
+            r"stability:?\s*-?\d+\.\d+\s*ev",
+            r"hull distance:?\s*\d+\.\d+\s*ev",
+        ),
+    ),
+    # SMACT validation results
+    (
+        "smact_validation",
+        (
+            r"smact.*valid(?:ation)?.*(?:valid|pass|✅)",
+            r"valid(?:ation)?.*confidence.*\d+\.?\d*",
+            r"confidence.*score.*\d+\.?\d*",
+            r"charge.?balanced?.*composition",
+            r"oxidation.*state.*valid",
+        ),
+    ),
+    # Crystal structure information
+    (
+        "crystal_structure",
+        (
+            r"space group:?\s*[A-Za-z0-9/-]+",
+            r"crystal system:?\s*[A-Za-z]+",
+            r"lattice parameters?:?\s*a\s*=\s*\d+",
+            r"unit cell.*volume.*\d+",
+            r"symmetry.*[A-Za-z0-9/-]+",
+        ),
+    ),
+    # Chemeleon-specific outputs
+    (
+        "structure_generation",
+        (
+            r"structure.*generated.*chemeleon",
+            r"cif.*format.*structure",
+            r"polymorph.*predicted",
+            r"diffusion.*model.*structure",
+        ),
+    ),
+    # MACE-specific outputs
+    (
+        "energy_calculation",
+        (
+            r"mace.*calculated.*energy",
+            r"forces.*calculated",
+            r"uncertainty.*eV",
+            r"committee.*models",
+        ),
+    ),
+    # General computational claims
+    (
+        "computational_claims",
+        (
+            r"calculated using",
+            r"computed with",
+            r"predicted by",
+            r"analysis shows",
+            r"results indicate",
+        ),
+    ),
+)
+
+
+# Read-only category view exposed as ComputationalResultDetector.patterns
+_PATTERNS_BY_CATEGORY = MappingProxyType(dict(_COMPUTATIONAL_PATTERNS))
+
+# Compiled once so detection does not go through re's cache per pattern
+_COMPILED_COMPUTATIONAL_PATTERNS = tuple(
+    (category, tuple(re.compile(pattern) for pattern in pattern_list))
+    for category, pattern_list in _COMPUTATIONAL_PATTERNS
+)
+
+
+# Query keywords that suggest computation is needed, matched in a single scan
+_COMPUTATIONAL_INDICATORS = re.compile(
+    "|".join(
+        (
+            "validate",
+            "check",
+            "calculate",
+            "energy",
+            "stable",
+            "structure",
+            "formation",
+            "synthesis",
+            "properties",
+            "analysis",
+        )
+    )
+)
+
+
 class ComputationalResultDetector:
     """Detect patterns that indicate computational results in text."""
 
     def __init__(self):
-        self.patterns = {
-            # Formation energies and energies
-            "formation_energy": [
-                r"formation energy:?\s*-?\d+\.\d+\s*ev",
-                r"energy:?\s*-?\d+\.\d+\s*ev(?:/atom)?",
-                r"stability:?\s*-?\d+\.\d+\s*ev",
-                r"hull distance:?\s*\d+\.\d+\s*ev",
-            ],
-            # SMACT validation results
-            "smact_validation": [
-                r"smact.*valid(?:ation)?.*(?:valid|pass|✅)",
-                r"valid(?:ation)?.*confidence.*\d+\.?\d*",
-                r"confidence.*score.*\d+\.?\d*",
-                r"charge.?balanced?.*composition",
-                r"oxidation.*state.*valid",
-            ],
-            # Crystal structure information
-            "crystal_structure": [
-                r"space group:?\s*[A-Za-z0-9/-]+",
-                r"crystal system:?\s*[A-Za-z]+",
-                r"lattice parameters?:?\s*a\s*=\s*\d+",
-                r"unit cell.*volume.*\d+",
-                r"symmetry.*[A-Za-z0-9/-]+",
-            ],
-            # Chemeleon-specific outputs
-            "structure_generation": [
-                r"structure.*generated.*chemeleon",
-                r"cif.*format.*structure",
-                r"polymorph.*predicted",
-                r"diffusion.*model.*structure",
-            ],
-            # MACE-specific outputs
-            "energy_calculation": [
-                r"mace.*calculated.*energy",
-                r"forces.*calculated",
-                r"uncertainty.*eV",
-                r"committee.*models",
-            ],
-            # General computational claims
-            "computational_claims": [
-                r"calculated using",
-                r"computed with",
-                r"predicted by",
-                r"analysis shows",
-                r"results indicate",
-            ],
-        }
+        self.patterns = _PATTERNS_BY_CATEGORY
 
     def detect_computational_content(self, text: str) -> dict[str, list[str]]:
         """Detect computational content patterns in text."""
         detected = {}
         text_lower = text.lower()
 
-        for category, pattern_list in self.patterns.items():
+        for category, pattern_list in _COMPILED_COMPUTATIONAL_PATTERNS:
             matches = []
             for pattern in pattern_list:
-                found = re.findall(pattern, text_lower)
-                matches.extend(found)
+                matches.extend(pattern.findall(text_lower))
 
             if matches:
                 detected[category] = matches
@@ -150,7 +201,7 @@ class HallucinationValidator:
         has_computational_results = bool(computational_content)
 
         # Check if tools were actually called
-        tools_called = len(tool_calls) > 0
+        tools_called = bool(tool_calls)
 
         # Critical violation: computational results without tool calls
         if has_computational_results and not tools_called:
@@ -192,21 +243,7 @@ class HallucinationValidator:
 
     def _likely_computational(self, query: str) -> bool:
         """Check if query likely requires computation even if not explicitly flagged."""
-        computational_indicators = [
-            "validate",
-            "check",
-            "calculate",
-            "energy",
-            "stable",
-            "structure",
-            "formation",
-            "synthesis",
-            "properties",
-            "analysis",
-        ]
-
-        query_lower = query.lower()
-        return any(indicator in query_lower for indicator in computational_indicators)
+        return _COMPUTATIONAL_INDICATORS.search(query.lower()) is not None
 
     def _check_numerical_fabrication(
         self, response: str, tools_called: bool
@@ -0,0 +1,38 @@
+"""
+Unit tests for CrystaLyseConfig.validate_environment.
+
+Tests optional dependency detection and overall health status.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+from crystalyse.config import CrystaLyseConfig
+
+
+class TestValidateEnvironment:
+    """Tests for environment validation."""
+
+    def test_missing_optional_dependency_degrades(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a missing optional package is reported and degrades status."""
+        real_find_spec = importlib.util.find_spec
+
+        def fake_find_spec(name: str, *args, **kwargs):
+            if name == "mcp":
+                return None
+            return real_find_spec(name, *args, **kwargs)
+
+        monkeypatch.setattr(importlib.util, "find_spec", fake_find_spec)
+        status = CrystaLyseConfig().validate_environment()
+
+        assert status["dependencies"]["mcp"] is False
+        assert status["overall"] == "degraded"
+
+    def test_reports_all_optional_dependencies(self) -> None:
+        """Test every optional dependency has a status entry."""
+        status = CrystaLyseConfig().validate_environment()
+
+        assert {"openai_agents", "mcp"} <= status["dependencies"].keys()
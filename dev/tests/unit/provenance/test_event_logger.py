@@ -0,0 +1,99 @@
+"""
+Unit tests for the JSONL event logger.
+
+Tests buffered event writes and flushing behaviour.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from crystalyse.provenance.core.event_logger import JSONLLogger
+
+
+def _line_count(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return len(path.read_text(encoding="utf-8").splitlines())
+
+
+class TestJSONLLogger:
+    """Tests for JSONLLogger class."""
+
+    def test_events_buffered_until_flush(self, tmp_path: Path) -> None:
+        """Test events are held in memory until flushed."""
+        path = tmp_path / "events.jsonl"
+        logger = JSONLLogger(path)
+        logger.FLUSH_INTERVAL_S = float("inf")
+
+        logger.log("tool_start", {"tool": "smact"})
+        assert _line_count(path) == 0
+
+        logger.flush()
+        assert _line_count(path) == 1
+        logger.close()
+
+    def test_flush_after_batch_size(self, tmp_path: Path) -> None:
+        """Test a full batch is written without an explicit flush."""
+        path = tmp_path / "events.jsonl"
+        logger = JSONLLogger(path)
+        logger.FLUSH_INTERVAL_S = float("inf")
+
+        for i in range(logger.FLUSH_EVERY):
+            logger.log("tool_end", {"index": i})
+
+        assert _line_count(path) == logger.FLUSH_EVERY
+        logger.close()
+
+    def test_session_end_flushes(self, tmp_path: Path) -> None:
+        """Test session end writes all pending events."""
+        path = tmp_path / "events.jsonl"
+        logger = JSONLLogger(path)
+        logger.FLUSH_INTERVAL_S = float("inf")
+
+        logger.log_session_start("session_1")
+        logger.log_tool_start("smact_validate", "call_1")
+        logger.log_session_end("session_1", {"status": "ok"})
+
+        assert _line_count(path) == 3
+        logger.close()
+
+    def test_read_events_includes_buffered(self, tmp_path: Path) -> None:
+        """Test read_events sees events that have not been flushed yet."""
+        logger = JSONLLogger(tmp_path / "events.jsonl")
+        logger.FLUSH_INTERVAL_S = float("inf")
+
+        logger.log("material", {"formula": "LiCoO2"})
+        events = logger.read_events()
+
+        assert len(events) == 1
+        assert events[0]["type"] == "material"
+        assert events[0]["data"]["formula"] == "LiCoO2"
+        assert logger.get_event_count() == 1
+        logger.close()
+
+    def test_directory_created_on_first_flush(self, tmp_path: Path) -> None:
+        """Test the log directory is only created once events are written."""
+        path = tmp_path / "runs" / "session_1" / "events.jsonl"
+        logger = JSONLLogger(path)
+        assert not path.parent.exists()
+
+        logger.log("tool_start", {"tool": "smact"})
+        logger.flush()
+
+        assert _line_count(path) == 1
+        logger.close()
+
+    def test_log_after_close_reopens(self, tmp_path: Path) -> None:
+        """Test close releases the handle and later events append to the file."""
+        path = tmp_path / "events.jsonl"
+        logger = JSONLLogger(path)
+
+        logger.log("discovery_start", {"query": "oxides"})
+        logger.close()
+        assert logger._file is None
+
+        logger.log("discovery_complete", {"status": "success"})
+        logger.close()
+
+        assert _line_count(path) == 2
@@ -0,0 +1,26 @@
+"""
+Unit tests for the MaterialsTracker.
+
+Tests composition normalization used to deduplicate materials.
+"""
+
+from __future__ import annotations
+
+from crystalyse.provenance.core.materials_tracker import MaterialsTracker
+
+
+class TestNormalizeComposition:
+    """Tests for composition normalization."""
+
+    def test_element_order_is_normalized(self) -> None:
+        """Test that element orderings of one formula normalize identically."""
+        tracker = MaterialsTracker()
+
+        assert tracker._normalize_composition("LiCoO2") == "CoLiO2"
+        assert tracker._normalize_composition("CoLiO2") == "CoLiO2"
+
+    def test_repeated_elements_are_summed(self) -> None:
+        """Test that counts for a repeated element are combined."""
+        tracker = MaterialsTracker()
+
+        assert tracker._normalize_composition("FeOFeO2") == "Fe2O3"
@@ -0,0 +1,118 @@
+"""
+Unit tests for the Intelligent Render Gate.
+
+Tests number detection and classification helpers used to gate LLM output.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from crystalyse.provenance.render_gate import DetectedNumber, IntelligentRenderGate
+from crystalyse.provenance.value_registry import ProvenanceValueRegistry
+
+
+class TestMathematicalExpression:
+    """Tests for mathematical expression detection."""
+
+    def test_detects_arithmetic(self) -> None:
+        """Test that operators between numbers are detected."""
+        gate = IntelligentRenderGate()
+        assert gate._has_mathematical_expression("The total is 3 + 4")
+        assert gate._has_mathematical_expression("so 2 = 2 holds")
+        assert gate._has_mathematical_expression("a 3 × 3 supercell")
+
+    def test_detects_symbols_and_parentheses(self) -> None:
+        """Test that summation symbols and parenthetical numbers are detected."""
+        gate = IntelligentRenderGate()
+        assert gate._has_mathematical_expression("∑ over all sites")
+        assert gate._has_mathematical_expression("the energy (5 eV) is low")
+
+    def test_detects_written_operations(self) -> None:
+        """Test that two written operations count regardless of case."""
+        gate = IntelligentRenderGate()
+        assert gate._has_mathematical_expression("Take the SUM of both, Times two")
+        assert not gate._has_mathematical_expression("The sum is reported")
+
+    def test_plain_text_is_not_mathematical(self) -> None:
+        """Test that ordinary prose with numbers is not flagged."""
+        gate = IntelligentRenderGate()
+        assert not gate._has_mathematical_expression("The band gap is 1.5 eV")
+
+
+class TestNumberDetection:
+    """Tests for detecting numbers in text."""
+
+    def test_detects_numbers_with_units(self) -> None:
+        """Test that units are captured with their value."""
+        gate = IntelligentRenderGate()
+        numbers = gate._detect_numbers("Bulk modulus of 150 GPa and 1e-3 strain")
+
+        assert [n.value for n in numbers] == ["150 GPa", "1e-3"]
+
+    def test_units_are_case_insensitive(self) -> None:
+        """Test that unit matching ignores case."""
+        gate = IntelligentRenderGate()
+        numbers = gate._detect_numbers("Band gap of 3 ev")
+
+        assert numbers[0].value == "3 ev"
+
+
+class TestMaterialContext:
+    """Tests for material formula extraction."""
+
+    def test_extracts_multi_element_formula(self) -> None:
+        """Test that the first formula with two or more elements is returned."""
+        gate = IntelligentRenderGate()
+
+        assert gate._extract_material_context("Here LiCoO2 is stable") == "LiCoO2"
+
+    def test_ignores_text_without_formula(self) -> None:
+        """Test that plain text yields no material."""
+        gate = IntelligentRenderGate()
+
+        assert gate._extract_material_context("The sample is stable") is None
+
+
+class TestFindProvenance:
+    """Tests for provenance lookup of detected numbers."""
+
+    def test_strips_units_before_lookup(self) -> None:
+        """Test that unit suffixes are removed before parsing the value."""
+        registry = ProvenanceValueRegistry()
+        registry.register_tool_output(
+            tool_name="mace",
+            tool_call_id="call_1",
+            input_data={},
+            output_data={"bulk_modulus": 150.0},
+        )
+        gate = IntelligentRenderGate(registry)
+        sentence = "Bulk modulus of 150 GPa"
+        num = DetectedNumber(value="150 GPa", context=sentence, full_sentence=sentence)
+
+        provenance = gate._find_provenance(num, None)
+        assert provenance is not None
+        assert provenance.value == 150.0
+
+
+class TestAnalyzeOutput:
+    """Tests for full output analysis."""
+
+    def test_numbers_in_same_sentence_classified_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each sentence is classified once and shared by its numbers."""
+        gate = IntelligentRenderGate()
+        calls = []
+        classify = gate._classify_number
+
+        def counting_classify(num):
+            calls.append(num.full_sentence)
+            return classify(num)
+
+        monkeypatch.setattr(gate, "_classify_number", counting_classify)
+        _, numbers, _ = gate.analyze_output("Bulk modulus of 150 GPa and 1e-3 strain")
+
+        assert len(numbers) == 2
+        assert len(calls) == 1
+        assert numbers[0].number_type == numbers[1].number_type
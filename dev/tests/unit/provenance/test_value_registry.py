@@ -6,9 +6,12 @@ Tests the central registry that maps values to their computational provenance.
 
 from __future__ import annotations
 
+import json
+from dataclasses import fields
 from typing import Any
 
 from crystalyse.provenance.artifact_tracker import ArtifactTracker
+from crystalyse.provenance.render_gate import IntelligentRenderGate
 from crystalyse.provenance.value_registry import (
     ProvenancedValue,
     ProvenanceValueRegistry,
@@ -103,6 +106,27 @@ class TestProvenanceValueRegistry:
         assert artifact_id is not None
         assert len(artifact_id) > 0
 
+    def test_get_provenance_data_serializes_values(self) -> None:
+        """Test registry entries are exported as JSON-ready dicts with every field."""
+        registry = ProvenanceValueRegistry()
+        registry.register_tool_output(
+            tool_name="mace",
+            tool_call_id="call_1",
+            input_data={},
+            output_data={"formula": "LiCoO2", "band_gap": 1.5},
+            timestamp="2025-01-20T12:00:00Z",
+        )
+
+        data = registry.get_provenance_data()
+        entry = data["registry"][1.5][0]
+
+        assert set(entry) == {f.name for f in fields(ProvenancedValue)}
+        assert entry["source_tool"] == "mace"
+        assert entry["timestamp"] == "2025-01-20T12:00:00Z"
+        assert entry["property_type"] == "band_gap"
+        assert entry["material"] == "LiCoO2"
+        json.dumps(data)
+
     def test_lookup_provenance_exact_match(self, sample_tool_output: dict[str, Any]) -> None:
         """Test looking up provenance with exact value match."""
         registry = ProvenanceValueRegistry()
@@ -355,6 +379,88 @@ class TestProvenanceLookupEdgeCases:
         found = [e_total, e_per_atom, e_form]
         assert any(p is not None for p in found)
 
+    def test_fuzzy_match_across_bucket_boundary(self) -> None:
+        """Test fuzzy lookup finds values indexed in a neighbouring bucket."""
+        registry = ProvenanceValueRegistry()
+        registry.register_tool_output(
+            tool_name="test",
+            tool_call_id="call_1",
+            input_data={},
+            output_data={"band_gap": 1.999},
+        )
+
+        provenance = registry.lookup_provenance(2.004)
+        assert provenance is not None
+        assert provenance.value == 1.999
+
+    def test_fuzzy_match_prefers_earliest_registered(self) -> None:
+        """Test fuzzy lookup returns the first registered value within tolerance."""
+        registry = ProvenanceValueRegistry()
+        for call_id, band_gap in [("call_1", 2.005), ("call_2", 1.998)]:
+            registry.register_tool_output(
+                tool_name="test",
+                tool_call_id=call_id,
+                input_data={},
+                output_data={"band_gap": band_gap},
+            )
+
+        provenance = registry.lookup_provenance(2.0)
+        assert provenance is not None
+        assert provenance.value == 2.005
+
+    def test_clear_resets_fuzzy_index(self) -> None:
+        """Test that clearing the registry also clears the fuzzy lookup index."""
+        registry = ProvenanceValueRegistry()
+        registry.register_tool_output(
+            tool_name="test",
+            tool_call_id="call_1",
+            input_data={},
+            output_data={"band_gap": 1.5},
+        )
+
+        registry.clear()
+
+        assert registry.lookup_provenance(1.501) is None
+
+
+class TestLargeValues:
+    """Tests for values too large to place in the fuzzy lookup index."""
+
+    def test_register_and_lookup_large_value(self) -> None:
+        """Test that huge finite values register and are found again."""
+        registry = ProvenanceValueRegistry()
+        registry.register_tool_output(
+            tool_name="mace",
+            tool_call_id="call_1",
+            input_data={},
+            output_data={"bulk_modulus": 5e307},
+        )
+
+        provenance = registry.lookup_provenance(5e307)
+        assert provenance is not None
+        assert provenance.value == 5e307
+        assert registry.lookup_provenance(4e307) is None
+
+    def test_lookup_large_value_in_empty_registry(self) -> None:
+        """Test that looking up a huge value without a match returns None."""
+        registry = ProvenanceValueRegistry()
+        registry.register_tool_output(
+            tool_name="test",
+            tool_call_id="call_1",
+            input_data={},
+            output_data={"band_gap": 1.5},
+        )
+
+        assert registry.lookup_provenance(5e307) is None
+
+    def test_render_gate_handles_large_value(self) -> None:
+        """Test that the render gate analyzes output containing a huge number."""
+        gate = IntelligentRenderGate(ProvenanceValueRegistry())
+
+        _, numbers, _ = gate.analyze_output("The band gap of LiCoO2 is 5e307 eV")
+
+        assert "5e307" in [n.value for n in numbers]
+
 
 class TestTimestampHandling:
     """Tests for timestamp handling in provenance."""
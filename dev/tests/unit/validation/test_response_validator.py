@@ -0,0 +1,56 @@
+"""
+Unit tests for the hallucination validator.
+
+Tests query classification used to decide whether validation applies.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from crystalyse.validation.response_validator import (
+    ComputationalResultDetector,
+    HallucinationValidator,
+)
+
+
+class TestComputationalResultDetector:
+    """Tests for computational content detection."""
+
+    def test_patterns_keyed_by_category(self) -> None:
+        """Test that patterns are exposed as a read-only mapping by category."""
+        detector = ComputationalResultDetector()
+
+        assert "formation_energy" in detector.patterns
+        with pytest.raises(TypeError):
+            detector.patterns["custom"] = ()
+
+    def test_detects_energy_claim(self) -> None:
+        """Test that a stated formation energy is detected by category."""
+        detector = ComputationalResultDetector()
+
+        detected = detector.detect_computational_content("Formation energy: -1.23 eV")
+
+        assert detected["formation_energy"] == ["formation energy: -1.23 ev", "energy: -1.23 ev"]
+
+
+class TestLikelyComputational:
+    """Tests for computational query detection."""
+
+    def test_detects_indicator_keyword(self) -> None:
+        """Test that a query mentioning a computational keyword is flagged."""
+        validator = HallucinationValidator()
+
+        assert validator._likely_computational("Calculate the Formation Energy of LiCoO2")
+
+    def test_detects_keyword_inside_word(self) -> None:
+        """Test that indicators still match as substrings of longer words."""
+        validator = HallucinationValidator()
+
+        assert validator._likely_computational("Is this phase metastable?")
+
+    def test_ignores_non_computational_query(self) -> None:
+        """Test that a conversational query is not flagged."""
+        validator = HallucinationValidator()
+
+        assert not validator._likely_computational("Hello, what can you do?")